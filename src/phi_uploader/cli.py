@@ -12,33 +12,79 @@ Usage examples are present in the README.md file.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import getpass
-import json
+import gzip
 import logging
+import math
+import os
+import random
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from importlib import resources  # std-lib 3.9+
-from typing import Dict, List, TypedDict, Any, Final, Iterable
+from typing import Dict, List, NamedTuple, TypedDict, Any, Final, Iterable
 
+import orjson
 import pandas as pd
 import requests
 import typing as t
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional streaming parser, see the ``fast`` extra
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:  # optional event-loop transport, see the ``async`` extra
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+try:  # optional HTTP/2 transport, see the ``http2`` extra
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:  # optional speed-up, see the ``fast`` extra
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover
+    pa = pacsv = None
 
 LOGGER = logging.getLogger(__name__)
 _DEFAULT_BASE_URL: Final[str] = "https://phidb.pnc.unipd.it/api/v1"
+_DEFAULT_CONCURRENCY: Final[int] = 4
+_RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 502, 503, 504})
+# X-RateLimit-Reset values further away than this are not trusted
+_MAX_RATE_WINDOW: Final[float] = 24 * 3600
+# Client-side throttling slower than one request per this many seconds is logged
+_THROTTLE_WARN_SECONDS: Final[float] = 5
+
+# Network failures worth retrying; safe because every upload carries an
+# Idempotency-Key the server can dedupe on
+_TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+if aiohttp is not None:
+    _TRANSIENT_ERRORS += (aiohttp.ClientConnectionError, asyncio.TimeoutError)
 
 # ---------------------------------------------------------------------------
 # Constants & helpers
 # ---------------------------------------------------------------------------
 class RequiredFields(TypedDict):
-    patient: List[str]
-    acquisition: List[str]
-    feature: List[str]
+    patient: tuple[str, ...]
+    acquisition: tuple[str, ...]
+    feature: tuple[str, ...]
 
 
 REQUIRED: Final[RequiredFields] = RequiredFields(
-    patient=[
+    patient=(
         "disease_id",
         "center_id",
         "data_id",
@@ -49,8 +95,8 @@ REQUIRED: Final[RequiredFields] = RequiredFields(
         "sex",
         "clinical",
         "behavioral",
-    ],
-    acquisition=[
+    ),
+    acquisition=(
         "remote_id",
         "acquisition_type",
         "general_comments",
@@ -72,14 +118,14 @@ REQUIRED: Final[RequiredFields] = RequiredFields(
         "vol_num",
         "acquisition_plan",
         "injec_info",
-    ],
-    feature=[
+    ),
+    feature=(
         "remote_id",
         "feature_type",
-    ],
+    ),
 )
 
-VALID_ACQ_TYPES: Final[set[str]] = {
+VALID_ACQ_TYPES: Final[frozenset[str]] = frozenset({
     "fMRI_rest",
     "perf",
     "T2w",
@@ -98,10 +144,10 @@ VALID_ACQ_TYPES: Final[set[str]] = {
     "tof",
     "SWI",
     "SE",
-    "PCM"
-}
+    "PCM",
+})
 
-VALID_FEATURE_TYPES: Final[set[str]] = {
+VALID_FEATURE_TYPES: Final[frozenset[str]] = frozenset({
     "dwi",
     "anat",
     "lesion",
@@ -109,10 +155,24 @@ VALID_FEATURE_TYPES: Final[set[str]] = {
     "eeg",
     "func",
     "perf",
-}
+})
 
 ID_COLUMNS: Final[tuple[str, ...]] = ("participant_id", "remote_id", "data_id")
 
+
+class KindSpec(NamedTuple):
+    required: tuple[str, ...]
+    template_name: str
+    valid_types: frozenset[str] | None = None
+    type_column: str | None = None
+
+
+KIND_SPEC: Final[dict[str, KindSpec]] = {
+    "patient": KindSpec(REQUIRED["patient"], "Add patient"),
+    "acquisition": KindSpec(REQUIRED["acquisition"], "Add acquisition", VALID_ACQ_TYPES, "acquisition_type"),
+    "feature": KindSpec(REQUIRED["feature"], "Add feature", VALID_FEATURE_TYPES, "feature_type"),
+}
+
 # ---------------------------------------------------------------------------
 # Utility functions
 # ---------------------------------------------------------------------------
@@ -121,7 +181,9 @@ def _read_table(path: str | Path | None, string_cols: Iterable[str] | None = Non
     """Open *path* (csv/tsv/xlsx) to a :class:`pandas.DataFrame`.
 
     Returns ``None`` if *path* is ``None``. Raises ``FileNotFoundError`` or
-    ``ValueError`` for unsupported extensions.
+    ``ValueError`` for unsupported extensions. Spreadsheets are cached as
+    ``<name>.xlsx.parquet`` (when pyarrow is available) and reloaded from
+    there while the cache is newer than the spreadsheet.
     """
     if path is None:
         return None
@@ -131,82 +193,127 @@ def _read_table(path: str | Path | None, string_cols: Iterable[str] | None = Non
         raise FileNotFoundError(path)
 
     string_cols = tuple(dict.fromkeys(string_cols or ()))
+    # pandas ignores entries for columns the file does not have
+    dtype = {c: "string" for c in string_cols} or None
 
-    def _select_converters(
-        reader: t.Callable[..., pd.DataFrame],
-        *,
-        kwargs: dict[str, Any],
-    ) -> dict[str, t.Callable[[Any], str | None]]:
-        if not string_cols:
-            return {}
-        header_kwargs = {**kwargs, "nrows": 0}
-        try:
-            header_df = reader(path, **header_kwargs)
-            available = set(header_df.columns)
-        except Exception:
-            available = set(string_cols)
-        return {col: _coerce_raw_string for col in string_cols if col in available}
-
+    if path.suffix in (".csv", ".tsv") and pacsv is not None:
+        return _read_delimited_arrow(path, "," if path.suffix == ".csv" else "\t", string_cols)
     if path.suffix == ".csv":
-        kwargs = {"sep": ","}
-        converters = _select_converters(pd.read_csv, kwargs=kwargs)
-        return pd.read_csv(path, converters=converters or None, **kwargs)
+        return pd.read_csv(path, sep=",", dtype=dtype)
     if path.suffix == ".tsv":
-        kwargs = {"sep": "\t"}
-        converters = _select_converters(pd.read_csv, kwargs=kwargs)
-        return pd.read_csv(path, converters=converters or None, **kwargs)
+        return pd.read_csv(path, sep="\t", dtype=dtype)
     if path.suffix in (".xls", ".xlsx"):
-        kwargs: dict[str, Any] = {}
-        converters = _select_converters(pd.read_excel, kwargs=kwargs)
-        return pd.read_excel(path, converters=converters or None, **kwargs)
+        # Spreadsheets are slow to parse: keep a parquet copy next to them
+        cache = path.with_suffix(path.suffix + ".parquet")
+        if pa is not None and cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+            try:
+                return pd.read_parquet(cache)
+            except Exception as exc:
+                LOGGER.warning("Ignoring unreadable cache %s: %s", cache, exc)
+        df = pd.read_excel(path, dtype=dtype)
+        if pa is not None:
+            # Written aside and renamed, so an interrupted run never leaves a
+            # truncated cache behind
+            tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+            try:
+                df.to_parquet(tmp, index=False)
+                os.replace(tmp, cache)
+            except Exception as exc:
+                tmp.unlink(missing_ok=True)
+                LOGGER.debug("Could not cache %s as parquet: %s", path, exc)
+        return df
 
     raise ValueError(f"Unsupported table format: {path.suffix}")
 
 
+_ARROW_STRING_TYPES: Final[dict[Any, Any]] = (
+    {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")} if pa is not None else {}
+)
+
+
+def _read_delimited_arrow(path: Path, sep: str, string_cols: tuple[str, ...]) -> pd.DataFrame:
+    """Parse a csv/tsv with the multi-threaded Arrow reader.
+
+    *string_cols* are kept verbatim (e.g. ``"001"``). Text columns stay in
+    Arrow buffers as ``string[pyarrow]`` instead of one Python object per
+    cell. Arrow also infers date/time columns, which pandas does not; those
+    are re-read as plain text so the payloads stay JSON-serialisable.
+    """
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+    column_types = {c: pa.string() for c in string_cols}
+    while True:
+        table = pacsv.read_csv(
+            path,
+            parse_options=parse_options,
+            convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+        )
+        temporal = [
+            f.name for f in table.schema
+            if pa.types.is_temporal(f.type) and f.name not in column_types
+        ]
+        if not temporal:
+            return table.to_pandas(types_mapper=_ARROW_STRING_TYPES.get)
+        column_types.update({c: pa.string() for c in temporal})
+
+
 def _ensure_columns(df: pd.DataFrame, required: Iterable[str]) -> pd.DataFrame:
-    """Add *required* columns missing from *df* (filled with ``None``)."""
-    for col in required:
-        if col not in df.columns:
-            LOGGER.warning("Adding missing column: %s", col)
-            df[col] = None
-    return df[list(required)]
-
-
-def _fill_nans(obj: dict[str, Any]) -> dict[str, Any]:
-    """Replace NaNs in *obj* **in‑place** with ``None`` and return it."""
-    for k, v in obj.items():
-        if isinstance(v, float) and pd.isna(v):
-            obj[k] = None
-    return obj
+    """Project *df* onto *required*, adding missing columns as nulls."""
+    required = list(required)
+    missing = [c for c in required if c not in df.columns]
+    if missing:
+        LOGGER.warning("Adding missing columns: %s", ", ".join(missing))
+    return df.reindex(columns=required)
+
+
+_STRING_ID_FIELDS: Final[tuple[str, ...]] = ("data_id", "remote_id")
+
+
+def _stringify_id_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorised :func:`_stringify_ids`: return *df* with its ID columns as strings."""
+    cols = [c for c in _STRING_ID_FIELDS if c in df.columns]
+    if not cols:
+        return df
+    return df.assign(**{c: df[c].astype(object).where(df[c].isna(), df[c].astype(str)) for c in cols})
 
 
 def _stringify_ids(obj: dict[str, Any]) -> dict[str, Any]:
-    for field in ("data_id", "remote_id"):
+    for field in _STRING_ID_FIELDS:
         value = obj.get(field)
         if value is not None and not isinstance(value, str):
             obj[field] = str(value)
     return obj
 
 
-def _coerce_raw_string(value: Any) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, float) and pd.isna(value):
-        return None
-    return str(value)
+def _dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialise *obj* to a JSON string, pretty-printed if *indent*."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialise *obj* to compact UTF-8 JSON bytes, ready to send as a body."""
+    return orjson.dumps(obj)
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON *data*; passing ``bytes`` skips a decode to ``str``."""
+    return orjson.loads(data)
 
 
 # ---------------------------------------------------------------------------
 # Postman collection generation
 # ---------------------------------------------------------------------------
 
-def _load_postman_template(template_path: str | Path, item_name: str) -> dict:
-    """Return a deep copy of *item_name* from an existing Postman collection."""
-    collection = json.loads(Path(template_path).read_text(encoding="utf-8"))
-    for it in collection.get("item", []):
-        if it.get("name") == item_name:
-            return it  # shallow copy is fine – we deepcopy later
-    raise ValueError(f"{item_name!r} not found in {template_path}")
+@functools.lru_cache(maxsize=8)
+def _load_template_file(path: str) -> dict:
+    """Parse the Postman collection at *path* once per process.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _loads(Path(path).read_bytes())
+
+
+# Stand-in for ``body.raw`` while serialising the template part of an item
+_RAW_PLACEHOLDER: Final = "\x00raw\x00"
 
 
 def _build_collection(
@@ -218,21 +325,38 @@ def _build_collection(
 ) -> None:
     """Write a Postman collection to *out_path*.
 
-    Each row of *payloads* becomes a copy of *template_item* with its
-    ``body.raw`` replaced.
+    Each row of *payloads* becomes an item shaped like *template_item* with
+    its ``body.raw`` replaced. The template part of an item is serialised
+    once; per row only the encoded ``raw`` string is spliced in between.
     """
     if n_rows:
         LOGGER.info("Building collection with only %d rows (testing purpose)", n_rows)
     n = int(n_rows or len(payloads))
-    collection: dict = {"item": [json.loads(json.dumps(template_item)) for _ in range(n)]}
-
-    for idx, row in payloads.iloc[:n].iterrows():
-        body = _fill_nans(row.to_dict())
-        body = _stringify_ids(body)
-        collection["item"][idx]["request"]["body"]["raw"] = json.dumps(body, indent=4)
-
-    collection["item"].append(login_snippet)
-    Path(out_path).write_text(json.dumps(collection, indent=4), encoding="utf-8")
+    static = {k: v for k, v in template_item.items() if k != "request"}
+    static_req = {k: v for k, v in template_item["request"].items() if k != "body"}
+    static_body = {k: v for k, v in template_item["request"].get("body", {}).items() if k != "raw"}
+    skeleton = _dumps_bytes({
+        **static,
+        "request": {**static_req, "body": {**static_body, "raw": _RAW_PLACEHOLDER}},
+    })
+    head, _, tail = skeleton.partition(_dumps_bytes(_RAW_PLACEHOLDER))
+
+    rows = _stringify_id_columns(payloads.iloc[:n])
+    cols = rows.columns.tolist()
+    # NaN → None is fused into the single conversion to an object array
+    values = rows.to_numpy(dtype=object, na_value=None)
+
+    # Stream one item per line so the whole collection never exists as a
+    # single string in memory
+    with Path(out_path).open("wb") as f:
+        f.write(b'{"item": [\n')
+        for row in values:
+            f.write(head)
+            f.write(_dumps_bytes(_dumps(dict(zip(cols, row)))))
+            f.write(tail)
+            f.write(b",\n")
+        f.write(_dumps_bytes(login_snippet))
+        f.write(b"\n]}\n")
     LOGGER.info("Wrote %s", out_path)
 
 
@@ -247,9 +371,24 @@ def get_authenticated_session(
     *,
     verify_tls: bool | str = True,
     timeout: int = 30,
+    pool_size: int = _DEFAULT_CONCURRENCY,
 ) -> requests.Session:
-    """Return a :pyclass:`requests.Session` with the *Authorization* header set."""
+    """Return a :pyclass:`requests.Session` with the *Authorization* header set.
+
+    The connection pool holds *pool_size* keep-alive connections (never fewer
+    than the ``requests`` default), so that concurrent uploads sharing the
+    session reuse warm TLS connections instead of opening new ones. Transport
+    retries are disabled: :func:`bulk_upload` owns the retry policy.
+    """
     sess = requests.Session()
+    pool_size = max(pool_size, requests.adapters.DEFAULT_POOLSIZE)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=0, raise_on_status=False),
+    )
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
     resp = sess.post(
         f"{base_url}/auth/sign_in",
         json={"email": email, "password": password},
@@ -268,112 +407,534 @@ def get_authenticated_session(
     return sess
 
 
-def bulk_upload(
+def get_http2_client(
     sess: requests.Session,
+    *,
+    max_connections: int = 4,
+    verify_tls: bool | str = True,
+    timeout: int = 30,
+) -> "httpx.Client":
+    """Return an HTTP/2 :pyclass:`httpx.Client` carrying the auth headers of *sess*.
+
+    A single HTTP/2 connection multiplexes many concurrent requests, so
+    *max_connections* can stay far below the upload concurrency.
+    """
+    if httpx is None:
+        raise RuntimeError("HTTP/2 uploads need httpx: pip install 'phi-uploader[http2]'")
+    # httpx logs every request at INFO; the requests path logs none
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    headers = {k: sess.headers[k] for k in ("Authorization", "Content-Type", "Accept") if k in sess.headers}
+    return httpx.Client(
+        http2=True,
+        headers=headers,
+        verify=verify_tls,
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+
+
+class TokenBucket:
+    """Thread-safe client-side rate limiter.
+
+    Tokens refill continuously at *rate* per second up to *burst*; each
+    :meth:`acquire` consumes one, blocking until it is available. A *rate* of
+    ``math.inf`` disables throttling until :meth:`set_rate` is called with the
+    allowance advertised by the server. Rates taken from headers never make
+    a single token wait longer than *max_wait* seconds.
+    """
+
+    def __init__(self, rate: float = math.inf, burst: int = 1, max_wait: float = 60) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_wait = max_wait
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available and return ``0``; otherwise return
+        the number of seconds until the next token is due."""
+        with self._cond:
+            if math.isinf(self.rate):
+                return 0.0
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        with self._cond:
+            while (wait := self.try_acquire()) > 0:
+                self._cond.wait(wait)
+
+    async def acquire_async(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._cond:
+            if not math.isinf(self.rate):
+                self._refill()
+            self.rate = rate
+            self._stamp = time.monotonic()
+            self._cond.notify_all()
+
+    def update_from_headers(self, headers: t.Mapping[str, str]) -> None:
+        """Spread the remaining ``X-RateLimit-*`` allowance over the current window.
+
+        Reset values more than a day away (e.g. millisecond timestamps) are
+        ignored, and the resulting interval is capped at *max_wait*. Headers
+        that cannot be used leave the rate unchanged; this never raises.
+        """
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            if reset > 1e9:  # epoch timestamp rather than delta-seconds
+                reset -= time.time()
+            if reset <= 0:
+                self.set_rate(math.inf)
+                return
+            if reset > _MAX_RATE_WINDOW:
+                return
+            interval = min(reset / max(remaining, 1.0), self.max_wait)
+            if interval <= 0:
+                return
+            if interval > _THROTTLE_WARN_SECONDS >= 1 / self.rate:
+                LOGGER.warning("Server rate limit reached – throttling to one request every %.1f s", interval)
+            self.set_rate(1 / interval)
+        except (ArithmeticError, ValueError) as exc:  # pragma: no cover
+            LOGGER.debug("Ignoring X-RateLimit headers %s/%s: %s", remaining, reset, exc)
+
+
+def _post_raw(
+    sess: requests.Session | "httpx.Client",
+    url: str,
+    raw: bytes,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30,
+) -> requests.Response | "httpx.Response":
+    """POST pre-encoded JSON *raw*; the session already sends ``Content-Type: application/json``."""
+    if httpx is not None and isinstance(sess, httpx.Client):
+        return sess.post(url, content=raw, headers=headers, timeout=timeout)
+    return sess.post(url, data=raw, headers=headers, timeout=timeout)
+
+
+def _request_body(raw: bytes, gzip_min_size: int | None = None) -> tuple[bytes, dict[str, str]]:
+    """Return the bytes to send for the encoded JSON *raw* and their extra headers.
+
+    The ``Idempotency-Key`` is random: callers build the body once before
+    their retry loop, so retries share the key while distinct records with
+    identical contents, or re-uploads in a later run, never do.
+
+    Bodies larger than *gzip_min_size* bytes are gzip-compressed at level 1 –
+    JSON records are repetitive enough that the fastest level already
+    captures most of the gain; ``None`` never compresses.
+    """
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    if gzip_min_size is not None and len(raw) > gzip_min_size:
+        return gzip.compress(raw, compresslevel=1), {**headers, "Content-Encoding": "gzip"}
+    return raw, headers
+
+
+def _header_float(headers: t.Mapping[str, str], name: str) -> float | None:
+    """Return header *name* as a finite float, or ``None`` if absent or unusable."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _backoff_caps(max_retries: int, base_backoff: float, max_backoff: float) -> tuple[float, ...]:
+    """Upper bound of the jittered sleep before each of the *max_retries* retries."""
+    return tuple(min(max_backoff, base_backoff * 2**i) for i in range(max_retries))
+
+
+def _retry_delay(
+    status: int | None,
+    headers: t.Mapping[str, str],
+    attempt: int,
+    *,
+    remote_id: t.Any,
+    caps: tuple[float, ...],
+) -> float | None:
+    """Return how long to sleep before retrying, or ``None`` to give up.
+
+    A *status* of ``None`` stands for a network error. Full-jitter
+    exponential backoff bounded by *caps*, never shorter than ``Retry-After``.
+    """
+    # Retry on “Too Many Requests”, transient server errors and network errors
+    if (status is not None and status not in _RETRY_STATUSES) or attempt >= len(caps):
+        return None
+    wait = random.uniform(0, caps[attempt])
+    retry_after = _header_float(headers, "Retry-After")
+    if retry_after is not None:
+        wait = max(wait, retry_after)
+    LOGGER.warning(
+        "%s (remote_id=%s) – retrying in %.1f s (attempt %d/%d)",
+        f"HTTP {status}" if status is not None else "Network error",
+        remote_id,
+        wait,
+        attempt + 1,
+        len(caps),
+    )
+    return wait
+
+
+def _post_with_retries(
+    sess: requests.Session | "httpx.Client",
+    url: str,
+    obj: t.Any,
+    *,
+    bucket: TokenBucket,
+    caps: tuple[float, ...],
+    label: t.Any,
+    gzip_min_size: int | None = None,
+    timeout: float = 30,
+) -> requests.Response | "httpx.Response":
+    """POST *obj* as JSON to *url*, retrying as :func:`_retry_delay` decides.
+
+    The body is encoded once and reused by every retry; each attempt takes
+    a token from *bucket* and may take up to *timeout* seconds. *label*
+    identifies the upload in retry logs. Network errors that outlast the
+    retries are re-raised.
+    """
+    data, headers = _request_body(_dumps_bytes(obj), gzip_min_size)
+    attempt = 0
+    while True:
+        bucket.acquire()
+        try:
+            r = _post_raw(sess, url, data, headers, timeout)
+            status, resp_headers = r.status_code, r.headers
+        except _TRANSIENT_ERRORS:
+            if attempt >= len(caps):
+                raise
+            status, resp_headers = None, {}
+        wait = _retry_delay(status, resp_headers, attempt, remote_id=label, caps=caps)
+        if wait is None:
+            return r
+        attempt += 1
+        time.sleep(wait)
+
+
+def _upload_result(
+    pl: dict[str, t.Any], status: int | None, body: t.Any, *, exc_info: bool = True
+) -> dict[str, t.Any]:
+    """Log the outcome of one upload and return its summary record.
+
+    A *status* of ``None`` means the upload raised; its traceback is logged
+    unless *exc_info* is false.
+    """
+    remote_id = pl.get("remote_id")
+    acq_type = pl.get("acquisition_type")
+    feat_type = pl.get("feature_type")
+    ok = status is not None and 200 <= status < 300
+
+    if status is None:
+        LOGGER.error(
+            "Unexpected error while uploading remote_id=%s: %s",
+            remote_id,
+            body,
+            exc_info=exc_info,
+        )
+    elif not ok:
+        LOGGER.error(
+            "Upload failed ‒ remote_id=%s, acquisition_type=%s, "
+            "feature_type=%s ‒ HTTP %s ‒ %s",
+            remote_id,
+            acq_type,
+            feat_type,
+            status,
+            body,
+        )
+    else:
+        LOGGER.info(
+            "Successful uploading ‒ remote_id=%s, acquisition_type=%s, "
+            "feature_type=%s ‒ HTTP %s",
+            remote_id,
+            acq_type,
+            feat_type,
+            status,
+        )
+
+    return {
+        "ok": ok,
+        "status": status,
+        "body": body,
+        "remote_id": remote_id,
+        "acquisition_type": acq_type,
+        "feature_type": feat_type,
+    }
+
+
+def _log_upload_start(pl: dict[str, t.Any]) -> None:
+    LOGGER.debug(
+        "Uploading payload ‒ remote_id=%s, acquisition_type=%s, feature_type=%s",
+        pl.get("remote_id"),
+        pl.get("acquisition_type"),
+        pl.get("feature_type"),
+    )
+
+
+def bulk_upload(
+    sess: requests.Session | "httpx.Client",
     url: str,
     payloads: list[dict[str, t.Any]],
     *,
     max_retries: int = 3,
-    base_backoff: int = 2,
+    base_backoff: float = 2,
+    max_backoff: float = 60,
+    concurrency: int = 1,
+    bucket: TokenBucket | None = None,
+    gzip_min_size: int | None = None,
+    timeout: float = 30,
 ) -> list[dict[str, t.Any]]:
     """
     POST each payload to *endpoint*. Returns a tiny per-record summary.
+
+    Up to *concurrency* requests are in flight at once; the summary keeps
+    the order of *payloads* regardless of completion order. All workers draw
+    from the same *bucket*, whose rate follows the server's ``X-RateLimit-*``
+    headers. 429/5xx responses are retried with full-jitter exponential
+    backoff, never waiting less than ``Retry-After``. Bodies above
+    *gzip_min_size* bytes are sent gzip-compressed. Each request may take up
+    to *timeout* seconds before it counts as a network error.
     """
-    res: list[dict[str, t.Any]] = []
-    for pl in payloads:
-        remote_id = pl.get("remote_id")
-        acq_type = pl.get("acquisition_type")
-        feat_type = pl.get("feature_type")
+    if bucket is None:
+        bucket = TokenBucket(burst=concurrency, max_wait=max_backoff)
+    caps = _backoff_caps(max_retries, base_backoff, max_backoff)
+    debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+
+    def _post_one(pl: dict[str, t.Any]) -> dict[str, t.Any]:
+        if debug_enabled:
+            _log_upload_start(pl)
+        try:
+            r = _post_with_retries(
+                sess,
+                url,
+                pl,
+                bucket=bucket,
+                caps=caps,
+                label=pl.get("remote_id"),
+                gzip_min_size=gzip_min_size,
+                timeout=timeout,
+            )
+        except Exception as exc:  # pragma: no cover
+            return _upload_result(pl, None, str(exc))
 
-        LOGGER.debug(
-            "Uploading payload ‒ remote_id=%s, acquisition_type=%s, feature_type=%s",
-            remote_id,
-            acq_type,
-            feat_type,
-        )
+        if 200 <= r.status_code < 300:
+            bucket.update_from_headers(r.headers)
 
+        # Try to read the server feedback – it usually helps understanding 4xx / 5xx errors
         try:
-            attempt = 0
-            while True:
-                r = sess.post(url, json=pl)
-                # Retry on “Too Many Requests”
-                if r.status_code != 429 or attempt >= max_retries:
-                    break
-
-                retry_after = r.headers.get("Retry-After")
-                wait = int(retry_after) if retry_after else base_backoff**attempt
-                attempt += 1
-                LOGGER.warning(
-                    "429 received (remote_id=%s) – retrying in %s s (attempt %d/%d)",
-                    remote_id,
-                    wait,
-                    attempt,
-                    max_retries,
-                )
-                time.sleep(wait)
+            body = _loads(r.content)
+        except ValueError:
+            body = r.text
+        return _upload_result(pl, r.status_code, body)
+
+    if concurrency <= 1:
+        return [_post_one(pl) for pl in payloads]
+
+    res: list[dict[str, t.Any]] = [{} for _ in payloads]
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        futures = {ex.submit(_post_one, pl): idx for idx, pl in enumerate(payloads)}
+        for fut in as_completed(futures):
+            res[futures[fut]] = fut.result()
+    return res
 
-            ok = r.status_code in (200, 201)
 
-            # Try to read the server feedback – it usually helps understanding 4xx / 5xx errors
-            try:
-                body = r.json()
-            except ValueError:
-                body = r.text
-
-            if not ok:
-                LOGGER.error(
-                    "Upload failed ‒ remote_id=%s, acquisition_type=%s, "
-                    "feature_type=%s ‒ HTTP %s ‒ %s",
-                    remote_id,
-                    acq_type,
-                    feat_type,
-                    r.status_code,
-                    body,
-                )
-            else:
-                LOGGER.info(
-                    "Successful uploading ‒ remote_id=%s, acquisition_type=%s, "
-                    "feature_type=%s ‒ HTTP %s",
-                    remote_id,
-                    acq_type,
-                    feat_type,
-                    r.status_code,
-                )
+def bulk_upload_batched(
+    sess: requests.Session | "httpx.Client",
+    url: str,
+    payloads: list[dict[str, t.Any]],
+    *,
+    batch_size: int = 200,
+    bulk_url: str | None = None,
+    max_retries: int = 3,
+    base_backoff: float = 2,
+    max_backoff: float = 60,
+    bucket: TokenBucket | None = None,
+    gzip_min_size: int | None = None,
+    timeout: float = 30,
+    **kwargs: t.Any,
+) -> list[dict[str, t.Any]]:
+    """POST *payloads* as JSON arrays of *batch_size* records.
+
+    Proposed server contract: ``POST {url}/bulk`` (or *bulk_url*) accepts a
+    JSON array and answers with an array of ``{"status": <int>, ...}``
+    objects, one per record and in the same order. If the server answers a
+    batch with 404/405 the endpoint is assumed missing and the remaining
+    payloads go through :func:`bulk_upload`, which receives *kwargs*. Each
+    batch takes one token from *bucket*, as does each fallback request.
+    """
+    bulk_url = bulk_url or f"{url}/bulk"
+    if bucket is None:
+        bucket = TokenBucket(burst=kwargs.get("concurrency", 1), max_wait=max_backoff)
+    caps = _backoff_caps(max_retries, base_backoff, max_backoff)
 
-            res.append(
-                {
-                    "ok": ok,
-                    "status": r.status_code,
-                    "body": body,
-                    "remote_id": remote_id,
-                    "acquisition_type": acq_type,
-                    "feature_type": feat_type,
-                }
+    res: list[dict[str, t.Any]] = []
+    for start in range(0, len(payloads), batch_size):
+        batch = payloads[start:start + batch_size]
+        try:
+            r = _post_with_retries(
+                sess,
+                bulk_url,
+                batch,
+                bucket=bucket,
+                caps=caps,
+                label=f"batch {start // batch_size}",
+                gzip_min_size=gzip_min_size,
+                timeout=timeout,
             )
         except Exception as exc:  # pragma: no cover
-            LOGGER.error(
-                "Unexpected error while uploading remote_id=%s: %s",
-                remote_id,
-                exc,
-                exc_info=True,
+            # One traceback for the whole batch, not one per record
+            LOGGER.error("Batch %d (%d records) failed", start // batch_size, len(batch), exc_info=True)
+            res.extend(_upload_result(pl, None, str(exc), exc_info=False) for pl in batch)
+            continue
+
+        if r.status_code in (404, 405):
+            LOGGER.warning(
+                "%s does not accept batches (HTTP %s) – uploading one record per request",
+                bulk_url,
+                r.status_code,
             )
-            res.append(
-                {
-                    "ok": False,
-                    "status": None,
-                    "body": str(exc),
-                    "remote_id": remote_id,
-                    "acquisition_type": acq_type,
-                    "feature_type": feat_type,
-                }
+            return res + bulk_upload(
+                sess,
+                url,
+                payloads[start:],
+                max_retries=max_retries,
+                base_backoff=base_backoff,
+                max_backoff=max_backoff,
+                bucket=bucket,
+                gzip_min_size=gzip_min_size,
+                timeout=timeout,
+                **kwargs,
             )
+        if 200 <= r.status_code < 300:
+            bucket.update_from_headers(r.headers)
+
+        try:
+            body = _loads(r.content)
+        except ValueError:
+            body = r.text
+        if isinstance(body, list) and len(body) == len(batch):
+            res.extend(
+                _upload_result(pl, item.get("status", r.status_code) if isinstance(item, dict) else r.status_code, item)
+                for pl, item in zip(batch, body)
+            )
+        else:
+            res.extend(_upload_result(pl, r.status_code, body) for pl in batch)
     return res
 
 
+async def bulk_upload_async(
+    sess: requests.Session,
+    url: str,
+    payloads: list[dict[str, t.Any]],
+    *,
+    max_retries: int = 3,
+    base_backoff: float = 2,
+    max_backoff: float = 60,
+    concurrency: int = 50,
+    bucket: TokenBucket | None = None,
+    gzip_min_size: int | None = None,
+    timeout: int = 30,
+) -> list[dict[str, t.Any]]:
+    """Event-loop counterpart of :func:`bulk_upload` built on :mod:`aiohttp`.
+
+    A single thread keeps up to *concurrency* requests in flight, which
+    scales to far more simultaneous uploads than a thread pool. Only the
+    auth headers of *sess* are reused. The retry policy and summary records
+    are the same as :func:`bulk_upload`.
+    """
+    if aiohttp is None:
+        raise RuntimeError("Async uploads need aiohttp: pip install 'phi-uploader[async]'")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if bucket is None:
+        bucket = TokenBucket(burst=concurrency, max_wait=max_backoff)
+    auth_headers = {k: sess.headers[k] for k in ("Authorization", "Content-Type", "Accept") if k in sess.headers}
+
+    caps = _backoff_caps(max_retries, base_backoff, max_backoff)
+    debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+
+    async def _send(
+        s: "aiohttp.ClientSession", sem: asyncio.Semaphore, pl: dict[str, t.Any]
+    ) -> tuple[int, t.Mapping[str, str], bytes]:
+        data, headers = _request_body(_dumps_bytes(pl), gzip_min_size)
+        attempt = 0
+        while True:
+            async with sem:
+                await bucket.acquire_async()
+                try:
+                    async with s.post(url, data=data, headers=headers) as r:
+                        status, resp_headers, content = r.status, r.headers, await r.read()
+                except _TRANSIENT_ERRORS:
+                    if attempt >= len(caps):
+                        raise
+                    status, resp_headers = None, {}
+            wait = _retry_delay(status, resp_headers, attempt, remote_id=pl.get("remote_id"), caps=caps)
+            if wait is None:
+                return status, resp_headers, content
+            attempt += 1
+            await asyncio.sleep(wait)
+
+    async def _post_one(s: "aiohttp.ClientSession", sem: asyncio.Semaphore, pl: dict[str, t.Any]) -> dict[str, t.Any]:
+        if debug_enabled:
+            _log_upload_start(pl)
+        try:
+            status, resp_headers, content = await _send(s, sem, pl)
+        except Exception as exc:  # pragma: no cover
+            return _upload_result(pl, None, str(exc))
+
+        if 200 <= status < 300:
+            bucket.update_from_headers(resp_headers)
+
+        try:
+            body = _loads(content)
+        except ValueError:
+            body = content.decode("utf-8", errors="replace")
+        return _upload_result(pl, status, body)
+
+    sem = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(
+        headers=auth_headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=aiohttp.TCPConnector(limit=concurrency),
+    ) as s:
+        return list(await asyncio.gather(*(_post_one(s, sem, pl) for pl in payloads)))
+
+
 # ---------------------------------------------------------------------------
 # CLI layer
 # ---------------------------------------------------------------------------
 
+def _positive_int(value: str) -> int:
+    """argparse ``type=`` for options that need an integer ≥ 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _add_common_io_args(p: argparse.ArgumentParser) -> None:
 
     p.add_argument("--template", default=str(resources.files("phi_uploader").joinpath("template/postman.json")), help="Path to Postman JSON template")
@@ -385,6 +946,29 @@ def _add_common_io_args(p: argparse.ArgumentParser) -> None:
 
 # Build sub‑command ---------------------------------------------------------
 
+def _prepare_patients(df: pd.DataFrame, *, behavioral: bool, clinical: bool) -> None:
+    """Derive the patient-only columns of *df* **in‑place**."""
+    if behavioral:
+        df["behavioral"] = True
+    if clinical:
+        df["clinical"] = True
+    df["remote_id"] = df.get("participant_id")
+    df["data_id"] = df.get("participant_id")
+
+
+def _validate_types(col: pd.Series, valid_types: frozenset[str], kind: str) -> pd.Series:
+    """Return *col* as a categorical over *valid_types*.
+
+    Values outside the categories (including missing ones) get code ``-1``;
+    ``ValueError`` lists them.
+    """
+    cat = pd.Categorical(col, categories=sorted(valid_types))
+    invalid = cat.codes == -1
+    if invalid.any():
+        raise ValueError(f"Invalid {kind} types: {sorted(col[invalid].unique().tolist(), key=str)}")
+    return pd.Series(cat, index=col.index, name=col.name)
+
+
 def cli_build(argv: list[str]) -> None:
     ap = argparse.ArgumentParser("build", description="Generate Postman collections only.")
     _add_common_io_args(ap)
@@ -403,9 +987,12 @@ def cli_build(argv: list[str]) -> None:
     api_dir = root / "API"
     api_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(template_path, encoding="utf-8") as f:
-        full_template = json.load(f)
+    full_template = _load_template_file(str(template_path))
     login_snippet = [it for it in full_template["item"] if it["name"] == "Login"][-1]
+    # Index the template items once; a kind only needs its item if it has rows
+    templates_by_name: dict[str, dict] = {}
+    for it in full_template.get("item", []):
+        templates_by_name.setdefault(it.get("name"), it)
 
     def _try_read(path: str | None) -> pd.DataFrame | None:
         try:
@@ -414,59 +1001,30 @@ def cli_build(argv: list[str]) -> None:
             LOGGER.warning("File not found: %s. Skipping.", path)
             return None
 
-    patient_df = _try_read(ns.patient)
-    acquisition_df = _try_read(ns.acquisition)
-    feature_df = _try_read(ns.feature)
-
     # Helper to process each entity ------------------------------------
-    def _process(
-        kind: str,
-        df: pd.DataFrame | None,
-        *,
-        valid_types: set[str] | None = None,
-        item_name: str | None = None,
-        template_source_name: str | None = None,
-    ):
+    def _process(kind: str, df: pd.DataFrame | None) -> None:
         if df is None or df.empty:
             return
         LOGGER.info("%s rows in %s", len(df), kind)
-        req = REQUIRED[kind]  # type: ignore[index]
+        spec = KIND_SPEC[kind]
+        template_item = templates_by_name.get(spec.template_name)
+        if template_item is None:
+            raise ValueError(f"{spec.template_name!r} not found in {template_path}")
+        if kind == "patient" and template_item.get("name") != patient_item_name:
+            template_item = {**template_item, "name": patient_item_name}
         if kind == "patient":
-            if ns.behavioral:
-                df["behavioral"] = True
-            if ns.clinical:
-                df["clinical"] = True
+            _prepare_patients(df, behavioral=ns.behavioral, clinical=ns.clinical)
+        else:
             df["remote_id"] = df.get("participant_id")
-            df["data_id"] = df.get("participant_id")
-        elif kind in ("acquisition", "feature"):
-            df["remote_id"] = df.get("participant_id")
-        if valid_types:
-            if kind == 'acquisition':
-                invalid = set(df['acquisition_type'].unique()) - valid_types
-            elif kind == 'feature':
-                invalid = set(df['feature_type'].unique()) - valid_types
-            else:
-                invalid = set()
-            if invalid:
-                raise ValueError(f"Invalid {kind} types: {sorted(invalid)}")
-        df = _ensure_columns(df, req)
+        if spec.type_column:
+            df[spec.type_column] = _validate_types(df[spec.type_column], spec.valid_types or frozenset(), kind)
+        df = _ensure_columns(df, spec.required)
         outfile = api_dir / f"{ns.dataset}_add_{kind}_API.json"
-        template_source = template_source_name or f"Add {kind}"
-        target_name = item_name or template_source
-        tmpl = _load_postman_template(template_path, template_source)
-        if target_name != tmpl.get("name"):
-            tmpl = json.loads(json.dumps(tmpl))
-            tmpl["name"] = target_name
-        _build_collection(df, tmpl, login_snippet, outfile, ns.n_test)
-
-    _process(
-        "patient",
-        patient_df,
-        item_name=patient_item_name,
-        template_source_name="Add patient",
-    )
-    _process("acquisition", acquisition_df, valid_types=VALID_ACQ_TYPES)
-    _process("feature", feature_df, valid_types=VALID_FEATURE_TYPES)
+        _build_collection(df, template_item, login_snippet, outfile, ns.n_test)
+
+    _process("patient", _try_read(ns.patient))
+    _process("acquisition", _try_read(ns.acquisition))
+    _process("feature", _try_read(ns.feature))
 
 
 # Run (=build+upload) sub‑command -----------------------------------------
@@ -482,6 +1040,11 @@ def cli_run(argv: list[str]) -> None:
     ap.add_argument("--base-url", default=_DEFAULT_BASE_URL)
     ap.add_argument("--skip-build", default=True, action="store_true", help="Assume JSON collections already exist under --root/API")
     ap.add_argument("--retry-failed", default=False, action="store_true", help="(Re)upload only collections stored in API/not_uploaded")
+    ap.add_argument("--concurrency", type=_positive_int, default=_DEFAULT_CONCURRENCY, metavar="N", help="Number of uploads in flight at once")
+    ap.add_argument("--http2", default=False, action="store_true", help="Upload over a multiplexed HTTP/2 connection (needs httpx)")
+    ap.add_argument("--async", dest="use_async", default=False, action="store_true", help="Upload from a single asyncio event loop (needs aiohttp)")
+    ap.add_argument("--gzip-upload", default=False, action="store_true", help="Gzip request bodies larger than 512 bytes (the API must accept Content-Encoding: gzip)")
+    ap.add_argument("--batch-size", type=int, default=0, metavar="N", help="POST N records per request to the <endpoint>/bulk route (0 = one record per request)")
     ns = ap.parse_args(argv)
     patient_item_name = "Add patient 5M" if ns.patient_5m else "Add patient"
 
@@ -508,7 +1071,11 @@ def cli_run(argv: list[str]) -> None:
     api_dir = root / "API"
     source_dir = api_dir / "not_uploaded" if ns.retry_failed else api_dir
 
-    sess = get_authenticated_session(ns.email, ns.password, base_url=ns.base_url)
+    # Two kinds can upload at once, each with --concurrency requests in flight
+    sess = get_authenticated_session(ns.email, ns.password, base_url=ns.base_url, pool_size=2 * ns.concurrency)
+    client = get_http2_client(sess) if ns.http2 else sess
+    # X-RateLimit-* describe one budget for the token: every kind draws from it
+    bucket = TokenBucket(burst=ns.concurrency)
 
     def _upload(kind: str, endpoint: str, src: Path, item_name: str):
         f = src / f"{ns.dataset}_add_{kind}_API.json"
@@ -516,17 +1083,29 @@ def cli_run(argv: list[str]) -> None:
             LOGGER.warning("%s not found, skipping %s", f, kind)
             return
         payloads = load_payloads(f, item_name)
-        for p in payloads:
-            LOGGER.debug(
-                "Prepared %s payload ‒ remote_id=%s, acquisition_type=%s, feature_type=%s",
-                kind,
-                p.get("remote_id"),
-                p.get("acquisition_type"),
-                p.get("feature_type"),
-            )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for p in payloads:
+                LOGGER.debug(
+                    "Prepared %s payload ‒ remote_id=%s, acquisition_type=%s, feature_type=%s",
+                    kind,
+                    p.get("remote_id"),
+                    p.get("acquisition_type"),
+                    p.get("feature_type"),
+                )
 
         LOGGER.info("Uploading %d %s …", len(payloads), kind)
-        res = bulk_upload(sess, f"{ns.base_url}/{endpoint}", payloads)
+        url = f"{ns.base_url}/{endpoint}"
+        opts: dict[str, t.Any] = {
+            "concurrency": ns.concurrency,
+            "bucket": bucket,
+            "gzip_min_size": 512 if ns.gzip_upload else None,
+        }
+        if ns.batch_size > 0:
+            res = bulk_upload_batched(client, url, payloads, batch_size=ns.batch_size, **opts)
+        elif ns.use_async:
+            res = asyncio.run(bulk_upload_async(sess, url, payloads, **opts))
+        else:
+            res = bulk_upload(client, url, payloads, **opts)
         ok = sum(r["ok"] for r in res)  # type: ignore[arg-type]
         LOGGER.info("%s/%s %s uploaded ok", ok, len(res), kind)
 
@@ -550,16 +1129,19 @@ def cli_run(argv: list[str]) -> None:
         def update_tsv(folder: Path, label: str, new_rows: list[dict[str, t.Any]]) -> None:
             tsv_path = folder / f"{_basename()}_{label}.tsv"
             df_new = pd.DataFrame(new_rows)
-            if tsv_path.exists():
-                try:
+            header = not tsv_path.exists() or tsv_path.stat().st_size == 0
+            if not header:
+                # Only the header is read back, to line the new rows up with it
+                with tsv_path.open(encoding="utf-8") as fh:
+                    old_cols = fh.readline().rstrip("\r\n").split("\t")
+                if set(old_cols) == set(df_new.columns):
+                    df_new = df_new[old_cols]
+                else:
                     df_old = pd.read_csv(tsv_path, sep="\t")
-                    df_merged = pd.concat([df_old, df_new], ignore_index=True)
-                except Exception:
-                    df_merged = df_new
-            else:
-                df_merged = df_new
+                    df_new = pd.concat([df_old, df_new], ignore_index=True)
+                    header = True
             try:
-                df_merged.to_csv(tsv_path, sep="\t", index=False)
+                df_new.to_csv(tsv_path, sep="\t", index=False, mode="w" if header else "a", header=header)
             except Exception as exc:  # pragma: no cover
                 LOGGER.error("Could not write TSV summary %s: %s", tsv_path, exc)
 
@@ -577,28 +1159,50 @@ def cli_run(argv: list[str]) -> None:
                         "method": "POST",
                         "body": {
                             "mode": "raw",
-                            "raw": json.dumps(_stringify_ids(pl), indent=4),
+                            "raw": _dumps(_stringify_ids(pl), indent=True),
                         },
                     },
                 } for pl in fail_payloads]
                 col_obj = {"item": col_json}
-                col_path.write_text(json.dumps(col_obj, indent=4), encoding="utf-8")
+                col_path.write_text(_dumps(col_obj, indent=True), encoding="utf-8")
             except Exception as exc:  # pragma: no cover
                 LOGGER.error("Could not write collection %s: %s", col_path, exc)
 
-    _upload("patient", "patients", source_dir, patient_item_name)
-    _upload("acquisition", "imaging_acquisitions", source_dir, "Add acquisition")
-    _upload("feature", "features", source_dir, "Add feature")
+    try:
+        # Acquisitions and features reference existing patients, so patients go
+        # first; the two dependent kinds hit separate endpoints and files
+        _upload("patient", "patients", source_dir, patient_item_name)
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [
+                ex.submit(_upload, "acquisition", "imaging_acquisitions", source_dir, "Add acquisition"),
+                ex.submit(_upload, "feature", "features", source_dir, "Add feature"),
+            ]
+            for fut in futures:
+                fut.result()
+    finally:
+        client.close()
 
 
 # Utility extracted from legacy script -------------------------------------
 
 def load_payloads(collection_path: str | Path, item_name: str) -> List[Dict[str, Any]]:
-    col = json.loads(Path(collection_path).read_text(encoding="utf-8"))
+    """Return the parsed ``body.raw`` of every *item_name* item in a collection.
+
+    With :mod:`ijson` installed the collection is streamed item by item
+    rather than parsed as a whole.
+    """
     out: List[Dict[str, Any]] = []
-    for it in col.get("item", []):
-        if it.get("name") == item_name and it["request"]["body"]["mode"] == "raw":
-            out.append(json.loads(it["request"]["body"]["raw"]))
+    if ijson is not None:
+        with open(collection_path, "rb") as f:
+            items: Iterable[dict] = ijson.items(f, "item.item", use_float=True)
+            for it in items:
+                if it.get("name") == item_name and it["request"]["body"]["mode"] == "raw":
+                    out.append(_loads(it["request"]["body"]["raw"]))
+    else:
+        col = _loads(Path(collection_path).read_bytes())
+        for it in col.get("item", []):
+            if it.get("name") == item_name and it["request"]["body"]["mode"] == "raw":
+                out.append(_loads(it["request"]["body"]["raw"]))
     if not out:
         raise ValueError(f"{item_name!r} not found in {collection_path}")
     return out